@@ -1,6 +1,8 @@
 from src.pdf_extraction import DrawingExtractor
 from src.excel_handler import ExcelHandler
+from src.results_sink import make_records, open_sink
 import json
+import time
 from pathlib import Path
 
 def load_config(config_path="config.json"):
@@ -28,7 +30,26 @@ def validate_paths(config):
         
     return config['pdf_path'], config['excel_path']
 
-def process_drawings(pdf_path, excel_path):
+# Extractor method and ordered result fields for each supported page
+PAGE_EXTRACTORS = {
+    2: ('extract_page2_dimensions', ['total_length', 'hole_diameter', 'width']),
+    3: ('extract_page3_measurements', ['hole_edge_distance', 'chamfer_angle',
+                                       'hole_distance', 'counterbore_depth']),
+    5: ('extract_page5_measurements', ['disc_thickness', 'circle_diameter', 'all_diameters'])
+}
+
+def extract_pages(extractor, pages):
+    """Run the page extractors and return (page, data, timings) tuples"""
+    extracted = []
+    for page_num in pages:
+        method, fields = PAGE_EXTRACTORS[page_num]
+        start = time.perf_counter()
+        data = getattr(extractor, method)()
+        timings = {'extract_s': time.perf_counter() - start}
+        extracted.append((page_num, {field: data[field] for field in fields}, timings))
+    return extracted
+
+def process_drawings(pdf_path, excel_path, sink=None):
     """Main function to process drawings and update Excel"""
     # Initialize handlers
     extractor = DrawingExtractor(pdf_path)
@@ -37,57 +58,76 @@ def process_drawings(pdf_path, excel_path):
     try:
         # Read questions from Excel
         questions = excel_handler.read_questions()
+        pages = [page_num for page_num in PAGE_EXTRACTORS if page_num in questions]
         
-        # Initialize results dictionary
-        results = {2: [], 3: [], 5: []}
-        
-        # Process Page 2
-        if 2 in questions:
-            page2_data = extractor.extract_page2_dimensions()
-            results[2] = [
-                {'value': page2_data['total_length']},
-                {'value': page2_data['hole_diameter']},
-                {'value': page2_data['width']}
-            ]
-        
-        # Process Page 3
-        if 3 in questions:
-            page3_data = extractor.extract_page3_measurements()
-            results[3] = [
-                {'value': page3_data['hole_edge_distance']},
-                {'value': page3_data['chamfer_angle']},
-                {'value': page3_data['hole_distance']},
-                {'value': page3_data['counterbore_depth']}
-            ]
-        
-        # Process Page 5
-        if 5 in questions:
-            page5_data = extractor.extract_page5_measurements()
-            results[5] = [
-                {'value': page5_data['disc_thickness']},
-                {'value': page5_data['circle_diameter']},
-                {'value': page5_data['all_diameters']}
-            ]
-        
-        # Update Excel with results
-        for page_num, page_results in results.items():
-            if page_results:  # Only update if we have results for this page
-                excel_handler.update_answers(page_num, page_results)
+        # Extract and update Excel with results
+        for page_num, data, timings in extract_pages(extractor, pages):
+            excel_handler.update_answers(page_num, [{'value': value} for value in data.values()])
+            if sink is not None:
+                sink.write(make_records(pdf_path, page_num, data, timings))
     
     finally:
         # Ensure workbook is properly closed
         excel_handler.close()
 
+def process_batch(pdf_paths, sink, pages=None):
+    """
+    Process several drawings into a single results sink without touching Excel
+    Returns: List of (pdf_path, page, error message) for each failure; page is
+        None when the whole drawing was skipped
+    """
+    if pages is None:
+        pages = list(PAGE_EXTRACTORS)
+    failures = []
+    for pdf_path in pdf_paths:
+        if not Path(pdf_path).exists():
+            failures.append((pdf_path, None, f"File not found: {pdf_path}"))
+            print(f"Skipping {pdf_path}: file not found")
+            continue
+        
+        extractor = DrawingExtractor(pdf_path)
+        records = []
+        
+        # A failing page is reported and skipped so the other pages and drawings still run
+        for page_num in pages:
+            try:
+                for _, data, timings in extract_pages(extractor, [page_num]):
+                    records.extend(make_records(pdf_path, page_num, data, timings))
+            except Exception as e:
+                error = f"Page {page_num}: {str(e)}"
+                failures.append((pdf_path, page_num, error))
+                print(f"Error processing {pdf_path}: {error}")
+        
+        if records:
+            sink.write(records)
+    return failures
+
 def main():
     try:
         # Load configuration
         config = load_config()
         
+        # Batch mode: write every drawing to the results dataset only
+        if 'pdf_paths' in config:
+            if 'results_path' not in config:
+                raise KeyError("Missing required path: results_path")
+            with open_sink(config['results_path'], config.get('results_format')) as sink:
+                failures = process_batch(config['pdf_paths'], sink)
+            if failures:
+                print(f"Processing completed with {len(failures)} failed drawing(s)")
+            else:
+                print("Processing completed successfully")
+            return
+        
         # Validate and get paths
         pdf_path, excel_path = validate_paths(config)
         
-        # Process drawings
-        process_drawings(pdf_path, excel_path)
+        # Process drawings, optionally also writing to a results dataset
+        if 'results_path' in config:
+            with open_sink(config['results_path'], config.get('results_format')) as sink:
+                process_drawings(pdf_path, excel_path, sink)
+        else:
+            process_drawings(pdf_path, excel_path)
         print("Processing completed successfully")
         
     except Exception as e:
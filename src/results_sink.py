@@ -0,0 +1,176 @@
+import json
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+# Units for each extracted field, keyed by the names returned by DrawingExtractor
+FIELD_UNITS = {
+    'total_length': 'mm',
+    'hole_diameter': 'mm',
+    'width': 'mm',
+    'hole_edge_distance': 'mm',
+    'chamfer_angle': 'deg',
+    'hole_distance': 'mm',
+    'counterbore_depth': 'mm',
+    'disc_thickness': 'mm',
+    'circle_diameter': 'mm',
+    'all_diameters': 'mm',
+}
+
+RECORD_FIELDS = ['document', 'page', 'field', 'value', 'unit', 'symbol',
+                 'confidence', 'bbox', 'timings']
+
+
+def make_records(document, page, data, timings=None):
+    """
+    Flatten one page of extractor output into result records
+    Args:
+        document: Source PDF path or name
+        page: Page number the values were extracted from
+        data: Dictionary of field name -> value as returned by DrawingExtractor
+        timings: Optional dictionary of timing name -> seconds for this page
+    Returns: List of record dictionaries, one per value. List values such as
+        all_diameters are expanded into one record per item, keeping each
+        item's symbol; an empty list gives a single record with a null value.
+    """
+    document = str(document)
+    records = []
+    for field, value in data.items():
+        if isinstance(value, list):
+            items = value or [None]
+        else:
+            items = [value]
+        for item in items:
+            symbol = None
+            confidence = None
+            bbox = None
+            if isinstance(item, dict):
+                symbol = item.get('symbol')
+                confidence = item.get('confidence')
+                bbox = item.get('bbox')
+                item = item.get('value')
+            records.append({
+                'document': document,
+                'page': page,
+                'field': field,
+                'value': float(item) if item is not None else None,
+                'unit': FIELD_UNITS.get(field),
+                'symbol': symbol,
+                'confidence': confidence,
+                'bbox': list(bbox) if bbox is not None else None,
+                'timings': dict(timings) if timings else {},
+            })
+    return records
+
+
+class ResultsSink(ABC):
+    """Base class for bulk result outputs. Use as a context manager."""
+
+    @abstractmethod
+    def write(self, records):
+        """Write a list of result records"""
+
+    def close(self):
+        """Flush pending records and release the output"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlSink(ResultsSink):
+    """Stream records to a JSON Lines file, appending to existing content"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+    def write(self, records):
+        lines = [json.dumps(record, ensure_ascii=False) + '\n' for record in records]
+        self.file.writelines(lines)
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class ParquetSink(ResultsSink):
+    """
+    Buffer records and write them as row groups to a Parquet dataset
+    Args:
+        path: Dataset directory. Each sink writes its own part file so
+            repeated runs append to the same dataset.
+        batch_size: Number of records buffered before a row group is written
+    """
+
+    def __init__(self, path, batch_size=10000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet output: pip install pyarrow")
+
+        self.pa = pa
+        self.pq = pq
+        self.schema = pa.schema([
+            ('document', pa.string()),
+            ('page', pa.int32()),
+            ('field', pa.string()),
+            ('value', pa.float64()),
+            ('unit', pa.string()),
+            ('symbol', pa.string()),
+            ('confidence', pa.float64()),
+            ('bbox', pa.list_(pa.float64())),
+            ('timings', pa.map_(pa.string(), pa.float64())),
+        ])
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.file_path = self.path / f'part-{uuid.uuid4().hex}.parquet'
+        self.batch_size = batch_size
+        self.buffer = []
+        self.writer = None
+
+    def write(self, records):
+        self.buffer.extend(records)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records as a single row group"""
+        if not self.buffer:
+            return
+        columns = {name: [record[name] for record in self.buffer] for name in RECORD_FIELDS}
+        columns['timings'] = [list(t.items()) for t in columns['timings']]
+        table = self.pa.Table.from_pydict(columns, schema=self.schema)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(str(self.file_path), self.schema)
+        self.writer.write_table(table)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def open_sink(path, results_format=None, **kwargs):
+    """
+    Create a results sink for the given path
+    Args:
+        path: Output file (JSONL) or dataset directory (Parquet)
+        results_format: 'jsonl' or 'parquet'; inferred from the path suffix if
+            omitted ('.jsonl' for JSON Lines, anything else for Parquet)
+    """
+    if results_format is None:
+        results_format = 'jsonl' if Path(path).suffix.lower() == '.jsonl' else 'parquet'
+    results_format = results_format.lower()
+    if results_format == 'jsonl':
+        return JsonlSink(path)
+    if results_format == 'parquet':
+        return ParquetSink(path, **kwargs)
+    raise ValueError(f"Unsupported results format: {results_format}")
@@ -0,0 +1,116 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import main
+from src.results_sink import JsonlSink
+
+
+class StubExtractor:
+    """Returns fixed page data; drawings named short.pdf have no page 5"""
+
+    def __init__(self, pdf_path):
+        self.pdf_path = pdf_path
+
+    def extract_page2_dimensions(self):
+        return {'total_length': 120, 'hole_diameter': 8, 'width': 40}
+
+    def extract_page3_measurements(self):
+        return {'hole_edge_distance': 30, 'chamfer_angle': 45,
+                'hole_distance': 50, 'counterbore_depth': None}
+
+    def extract_page5_measurements(self):
+        if Path(self.pdf_path).name == 'short.pdf':
+            raise IndexError('list index out of range')
+        return {'disc_thickness': 3, 'circle_diameter': 80,
+                'all_diameters': [{'value': 6.0, 'symbol': 'M', 'context': 'M6'}]}
+
+
+class StubExcelHandler:
+    """Records update_answers calls instead of touching a workbook"""
+
+    def __init__(self, excel_path):
+        self.updates = []
+        StubExcelHandler.instance = self
+
+    def read_questions(self):
+        return {2: ['q'], 3: ['q'], 5: ['q']}
+
+    def update_answers(self, page_num, results):
+        self.updates.append((page_num, [r['value'] for r in results]))
+
+    def close(self):
+        pass
+
+
+class TestProcessBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.results_path = self.dir / 'results.jsonl'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_pdf(self, name):
+        path = self.dir / name
+        path.touch()
+        return str(path)
+
+    def read_records(self):
+        with open(self.results_path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    @mock.patch('main.DrawingExtractor', StubExtractor)
+    def test_failures_are_skipped_and_returned(self):
+        full = self.make_pdf('full.pdf')
+        short = self.make_pdf('short.pdf')
+        missing = str(self.dir / 'missing.pdf')
+
+        with JsonlSink(self.results_path) as sink:
+            failures = main.process_batch([missing, short, full], sink)
+
+        self.assertEqual(failures, [
+            (missing, None, f"File not found: {missing}"),
+            (short, 5, "Page 5: list index out of range"),
+        ])
+        records = self.read_records()
+        short_pages = {r['page'] for r in records if r['document'] == short}
+        full_pages = {r['page'] for r in records if r['document'] == full}
+        self.assertEqual(short_pages, {2, 3})
+        self.assertEqual(full_pages, {2, 3, 5})
+        self.assertFalse(any(r['document'] == missing for r in records))
+
+    @mock.patch('main.DrawingExtractor', StubExtractor)
+    def test_empty_pages_extracts_nothing(self):
+        pdf = self.make_pdf('full.pdf')
+        with JsonlSink(self.results_path) as sink:
+            failures = main.process_batch([pdf], sink, pages=[])
+        self.assertEqual(failures, [])
+        self.assertEqual(self.read_records(), [])
+
+    @mock.patch('main.ExcelHandler', StubExcelHandler)
+    @mock.patch('main.DrawingExtractor', StubExtractor)
+    def test_process_drawings_matches_excel_order(self):
+        pdf = self.make_pdf('full.pdf')
+        with JsonlSink(self.results_path) as sink:
+            main.process_drawings(pdf, 'checklist.xlsx', sink)
+
+        excel_rows = [(page, value) for page, values in StubExcelHandler.instance.updates
+                      for value in values]
+        records = self.read_records()
+        scalar_rows = [(r['page'], r['value']) for r in records if r['field'] != 'all_diameters']
+        expected = [(page, float(value) if value is not None else None)
+                    for page, value in excel_rows if not isinstance(value, list)]
+        self.assertEqual(scalar_rows, expected)
+        self.assertEqual([r['field'] for r in records], [
+            'total_length', 'hole_diameter', 'width',
+            'hole_edge_distance', 'chamfer_angle', 'hole_distance', 'counterbore_depth',
+            'disc_thickness', 'circle_diameter', 'all_diameters',
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
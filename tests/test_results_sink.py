@@ -0,0 +1,113 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.results_sink import JsonlSink, ParquetSink, ResultsSink, make_records, open_sink
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+class TestMakeRecords(unittest.TestCase):
+    def test_scalar_value(self):
+        records = make_records('part.pdf', 5, {'disc_thickness': 3}, {'extract_s': 1.5})
+        self.assertEqual(records, [{
+            'document': 'part.pdf',
+            'page': 5,
+            'field': 'disc_thickness',
+            'value': 3.0,
+            'unit': 'mm',
+            'symbol': None,
+            'confidence': None,
+            'bbox': None,
+            'timings': {'extract_s': 1.5},
+        }])
+
+    def test_none_value(self):
+        records = make_records('part.pdf', 3, {'chamfer_angle': None})
+        self.assertEqual(len(records), 1)
+        self.assertIsNone(records[0]['value'])
+        self.assertEqual(records[0]['unit'], 'deg')
+        self.assertEqual(records[0]['timings'], {})
+
+    def test_list_of_dicts_keeps_symbol(self):
+        diameters = [
+            {'value': 6.0, 'symbol': 'M', 'context': 'M6'},
+            {'value': 80.0, 'symbol': 'PCD', 'context': 'PCD 80'},
+        ]
+        records = make_records('part.pdf', 5, {'all_diameters': diameters})
+        self.assertEqual([r['value'] for r in records], [6.0, 80.0])
+        self.assertEqual([r['symbol'] for r in records], ['M', 'PCD'])
+        self.assertTrue(all(r['field'] == 'all_diameters' for r in records))
+
+    def test_empty_list_gives_null_record(self):
+        records = make_records('part.pdf', 5, {'all_diameters': []})
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['field'], 'all_diameters')
+        self.assertIsNone(records[0]['value'])
+        self.assertIsNone(records[0]['symbol'])
+
+
+class TestSinks(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_jsonl_round_trip_appends(self):
+        path = self.dir / 'results.jsonl'
+        first = make_records('a.pdf', 2, {'width': 40})
+        second = make_records('b.pdf', 2, {'width': None})
+        with JsonlSink(path) as sink:
+            sink.write(first)
+        with JsonlSink(path) as sink:
+            sink.write(second)
+        with open(path, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines, first + second)
+
+    def test_open_sink_infers_format(self):
+        with open_sink(self.dir / 'results.jsonl') as sink:
+            self.assertIsInstance(sink, JsonlSink)
+        with open_sink(self.dir / 'other.txt', results_format='JSONL') as sink:
+            self.assertIsInstance(sink, JsonlSink)
+        if pq is not None:
+            with open_sink(self.dir / 'dataset') as sink:
+                self.assertIsInstance(sink, ParquetSink)
+
+    def test_open_sink_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            open_sink(self.dir / 'results.csv', results_format='csv')
+
+    def test_sink_without_write_cannot_be_created(self):
+        class IncompleteSink(ResultsSink):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteSink()
+
+    @unittest.skipIf(pq is None, "pyarrow is not installed")
+    def test_parquet_round_trip(self):
+        records = make_records('a.pdf', 5, {
+            'disc_thickness': 3,
+            'all_diameters': [{'value': 6.0, 'symbol': 'M', 'context': 'M6'}],
+        }, {'extract_s': 0.5})
+        with ParquetSink(self.dir / 'dataset', batch_size=1) as sink:
+            sink.write(records[:1])
+            sink.write(records[1:])
+
+        files = list((self.dir / 'dataset').glob('*.parquet'))
+        self.assertEqual(len(files), 1)
+        columns = pq.read_table(str(files[0])).to_pydict()
+        self.assertEqual(columns['value'], [3.0, 6.0])
+        self.assertEqual(columns['symbol'], [None, 'M'])
+        self.assertEqual(columns['timings'][0], [('extract_s', 0.5)])
+
+
+if __name__ == '__main__':
+    unittest.main()